@@ -59,20 +59,21 @@ def _signal_shutdown(*_) -> None:
     logger.debug("Server shutdown signaled")
 
 
-def _generate_server() -> PulsarityServer:
+def _generate_server(configs: config.PulsarityConfig) -> PulsarityServer:
     """
     Serve the Pulsarity application from a Granian server
-    """
-    configs = config.config_manager
 
+    :param configs: The server configs to generate the server with
+    """
     app: ASGIApp = application.generate_pulsarity_application()
 
-    app = CORSMiddleware(
-        app,
-        allow_origins=configs.webserver.origins,
-        allow_methods=("GET", "POST"),
-        allow_headers=("Authorization", "Content-Type"),
-    )
+    if configs.webserver.origins:
+        app = CORSMiddleware(
+            app,
+            allow_origins=configs.webserver.origins,
+            allow_methods=("GET", "POST"),
+            allow_headers=("Authorization", "Content-Type"),
+        )
 
     return PulsarityServer(
         app,
@@ -88,9 +89,11 @@ def _generate_server() -> PulsarityServer:
     )
 
 
-async def _server() -> None:
+async def _server(configs: config.PulsarityConfig) -> None:
     """
     The Pulsarity webserver coroutine.
+
+    :param configs: The server configs to run the webserver with
     """
     if sys.platform == "win32":
         signal.signal(signal.Signals.SIGINT, _signal_shutdown)
@@ -100,7 +103,7 @@ async def _server() -> None:
         loop.add_signal_handler(signal.Signals.SIGINT, _signal_shutdown)
         loop.add_signal_handler(signal.Signals.SIGTERM, _signal_shutdown)
 
-    server = _generate_server()
+    server = _generate_server(configs)
 
     logger.debug("Granian server version: %s", granian.__version__)
     logger.info("Pulsarity application version: %s", pulsarity.__version__)
@@ -133,7 +136,7 @@ def main() -> None:
     """
     Path("logs").mkdir(exist_ok=True)
 
-    asyncio.run(_server())
+    asyncio.run(_server(config.config_manager))
 
     if ClientServerShutdown.shutdown_evt.is_set():
         return
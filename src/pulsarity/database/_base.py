@@ -36,6 +36,16 @@ class PulsarityBase(Model):
         return await cls.get_or_none(id=id_)
 
 
+class PulsaritySystemBase(PulsarityBase):
+    """
+    An Extention of `PulsarityBase` for system objects that can be
+    flagged as persistent
+    """
+
+    persistent = fields.BooleanField(default=False)
+    """Entry is persistent in database"""
+
+
 class PulsarityMessageBase(PulsarityBase):
     """
     An ABC Extention of `PulsarityBase` that includes a
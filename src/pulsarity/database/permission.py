@@ -9,13 +9,13 @@ from typing import TYPE_CHECKING
 
 from tortoise import fields
 
-from pulsarity.database._base import PulsarityBase as _PulsarityBase
+from pulsarity.database._base import PulsaritySystemBase as _PulsaritySystemBase
 
 if TYPE_CHECKING:
     from pulsarity.database.role import Role
 
 
-class Permission(_PulsarityBase):
+class Permission(_PulsaritySystemBase):
     """
     Role for the application
     """
@@ -28,8 +28,6 @@ class Permission(_PulsarityBase):
 
     value = fields.CharField(max_length=64, unique=True)
     """Name of role"""
-    persistent = fields.BooleanField(default=False)
-    """Entry is persistent in database"""
     roles: fields.ManyToManyRelation[Role]
     """Roles permission is assigned to"""
 
@@ -6,16 +6,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import async_lru
 from tortoise import fields
 
-from pulsarity.database._base import PulsarityBase as _PulsarityBase
+from pulsarity.database._base import PulsaritySystemBase as _PulsaritySystemBase
 from pulsarity.database.permission import Permission, SystemDefaultPerms
 
 if TYPE_CHECKING:
     from pulsarity.database.user import User
 
 
-class Role(_PulsarityBase):
+class Role(_PulsaritySystemBase):
     """
     Role for the application
     """
@@ -36,8 +37,6 @@ class Role(_PulsarityBase):
         through="role_permission",
     )
     """Permissions granted to a role"""
-    persistent = fields.BooleanField(default=False)
-    """Entry is persistent in database"""
 
     async def get_permissions(self) -> set[str]:
         """
@@ -56,6 +55,22 @@ class Role(_PulsarityBase):
         """
         await self.permissions.clear()
         await self.permissions.add(*permissions)
+        type(self).get_permissions_by_name.cache_invalidate(type(self), self.name)
+
+    @classmethod
+    @async_lru.alru_cache(ttl=30)
+    async def get_permissions_by_name(cls, name: str) -> frozenset[str]:
+        """
+        Gets the permissions for a role by the role name. Results are cached
+        briefly and refreshed when the role's permissions are changed.
+
+        :param name: The name of the role
+        :return: The set of permissions
+        """
+        permissions: list[str] = await Permission.filter(  # type: ignore
+            roles__name=name,
+        ).values_list("value", flat=True)
+        return frozenset(permissions)
 
     @classmethod
     async def verify_persistant(cls) -> None:
@@ -67,6 +82,7 @@ class Role(_PulsarityBase):
         permissions = await Permission.all()
 
         await admin_role.permissions.add(*permissions)
+        cls.get_permissions_by_name.cache_invalidate(cls, admin_role.name)
 
         unauth_role, created = await cls.get_or_create(
             name="UNAUTHENTICATED",
@@ -84,3 +100,4 @@ class Role(_PulsarityBase):
             ]
             permissions = await Permission.filter(value__in=perm_values)
             await unauth_role.permissions.add(*permissions)
+            cls.get_permissions_by_name.cache_invalidate(cls, unauth_role.name)
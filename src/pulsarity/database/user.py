@@ -4,6 +4,8 @@ ORM classes for User data
 
 import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from functools import cached_property
 from typing import Self
@@ -19,13 +21,19 @@ from argon2.exceptions import (
 )
 from tortoise import fields
 
-from pulsarity.database._base import PulsarityBase as _PulsarityBase
+from pulsarity.database._base import PulsaritySystemBase as _PulsaritySystemBase
+from pulsarity.database.permission import Permission
 from pulsarity.database.role import Role
 from pulsarity.utils import config
 
 logger = logging.getLogger(__name__)
 
 _PH = PasswordHasher()
+_HASH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.process_cpu_count(),
+    thread_name_prefix="pulsarity-argon2",
+)
+"""Executor dedicated to password hashing and verification"""
 
 
 async def _generate_hash(password: str) -> str:
@@ -38,7 +46,7 @@ async def _generate_hash(password: str) -> str:
     loop = asyncio.get_running_loop()
 
     try:
-        result = await loop.run_in_executor(None, _PH.hash, password)
+        result = await loop.run_in_executor(_HASH_EXECUTOR, _PH.hash, password)
     except HashingError:
         logger.exception("Failed to hash password")
         raise
@@ -54,7 +62,7 @@ async def _verify_password(pw_hash: str, password: str, uuid: UUID) -> bool:
 
     try:
         result = await loop.run_in_executor(
-            None,
+            _HASH_EXECUTOR,
             _PH.verify,
             pw_hash,
             password,
@@ -91,7 +99,7 @@ async def _check_password_rehash(pw_hash: str) -> bool:
     )
 
 
-class User(_PulsarityBase):
+class User(_PulsaritySystemBase):
     """
     User for the application
     """
@@ -122,8 +130,6 @@ class User(_PulsarityBase):
     """Time of last authenication"""
     reset_required = fields.BooleanField(default=True)
     """A flag signaling the user's password should be reset"""
-    persistent = fields.BooleanField(default=False)
-    """Entry is persistent in database"""
 
     @property
     def display_name(self) -> str:
@@ -155,6 +161,18 @@ class User(_PulsarityBase):
 
         return permissions
 
+    async def get_permissions(self) -> set[str]:
+        """
+        Gets the permissions for the user with a single query through the
+        user's roles. Does not require roles or permissions to be prefetched.
+
+        :return: The set of permissions
+        """
+        permissions: list[str] = await Permission.filter(  # type: ignore
+            roles__users__id=self.id,
+        ).values_list("value", flat=True)
+        return set(permissions)
+
     async def verify_password(self, password: str) -> bool:
         """
         Checks a hash of the provided password against the hash in the database
@@ -208,6 +226,7 @@ class User(_PulsarityBase):
         """
         hashed_password = await _generate_hash(password)
         await cls.filter(auth_id=uuid).update(_password_hash=hashed_password)
+        cls.get_by_uuid_prefetch.cache_invalidate(cls, uuid)
 
     @classmethod
     async def update_user_password_and_status(cls, uuid: UUID, password: str) -> None:
@@ -221,6 +240,7 @@ class User(_PulsarityBase):
             _password_hash=hashed_password,
             reset_required=False,
         )
+        cls.get_by_uuid_prefetch.cache_invalidate(cls, uuid)
 
     @classmethod
     async def get_by_uuid(cls, uuid: UUID) -> Self | None:
@@ -232,7 +252,7 @@ class User(_PulsarityBase):
         return await cls.get_or_none(auth_id=uuid)
 
     @classmethod
-    @async_lru.alru_cache()
+    @async_lru.alru_cache(maxsize=256, ttl=30)
     async def get_by_uuid_prefetch(cls, uuid: UUID) -> Self | None:
         """
         Attempt to retrieve a user by uuid. A successful retrieval will
@@ -253,17 +273,6 @@ class User(_PulsarityBase):
         """
         return await cls.get_or_none(username=username)
 
-    @classmethod
-    async def get_by_username_prefetch(cls, username: str) -> Self | None:
-        """
-        Attempt to retrieve a user by username
-
-        :param username: The username to search for
-        """
-        return await cls.get_or_none(username=username).prefetch_related(
-            "roles__permissions",
-        )
-
     @classmethod
     async def verify_persistant(cls) -> None:
         """
@@ -314,3 +323,4 @@ class User(_PulsarityBase):
         :param status: The value to set the status to
         """
         await cls.filter(auth_id=uuid).update(reset_required=status)
+        cls.get_by_uuid_prefetch.cache_invalidate(cls, uuid)
@@ -3,51 +3,135 @@ Global configurations
 """
 
 import asyncio
-import json
+import contextlib
 import logging
-from dataclasses import asdict, dataclass, field
-from datetime import UTC, datetime
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import datetime
 from functools import partial
 from pathlib import Path
 from secrets import token_urlsafe
+from tempfile import NamedTemporaryFile
 from typing import Any, Self
 
-import anyio
+import orjson
 
 from pulsarity.utils.logging import generate_default_config
 
 DEFAULT_CONFIG_FILE = Path("config.json")
+_JSON_OPTS = orjson.OPT_INDENT_2
+_SQLITE_PRAGMAS = {
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -64000,
+    "mmap_size": 268435456,
+}
+"""Pragmas applied to each sqlite connection in addition to the tortoise defaults"""
 
 # pylint: disable=E1134,R0902
 
 
 logger = logging.getLogger(__name__)
 
+_file_cache: dict[Path, tuple[int, bytes]] = {}
+"""Raw config file contents paired with the file modification time"""
+_file_locks: defaultdict[Path, asyncio.Lock] = defaultdict(asyncio.Lock)
+"""Locks serializing asynchronous writes to each config file"""
 
-def _parse_types(params: list[tuple[str, Any]]):
-    vals = {}
 
-    for key, val in params:
+def _load_file_data(filepath: Path) -> dict:
+    """
+    Loads the parsed contents of a config file. The raw contents are kept
+    so unchanged configs are not written back to the file.
+
+    :param filepath: The filepath to load the data from
+    :return: The parsed file contents
+    """
+    mtime = filepath.stat().st_mtime_ns
+    raw = filepath.read_bytes()
+    _file_cache[filepath] = (mtime, raw)
+
+    return orjson.loads(raw)
+
+
+def _write_file(filepath: Path, payload: bytes) -> int:
+    """
+    Atomically replaces the contents of a config file by writing to a
+    uniquely named temporary file first. The temporary file is synced to
+    disk before the replacement so a crash can not leave an empty config
+    in its place. The temporary file is removed if the write fails.
+
+    :param filepath: The filepath to write the payload to
+    :param payload: The serialized config
+    :return: The modification time of the written file
+    """
+    with NamedTemporaryFile(
+        "wb",
+        dir=filepath.parent,
+        prefix=f"{filepath.name}.",
+        suffix=".tmp",
+        delete=False,
+    ) as file:
+        try:
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+            file.close()
+            Path(file.name).replace(filepath)
+        except BaseException:
+            file.close()
+            Path(file.name).unlink(missing_ok=True)
+            raise
+
+    return filepath.stat().st_mtime_ns
+
+
+def _epoch_time() -> int:
+    """
+    Gets the current time as integer seconds since the epoch
+
+    :return: The current epoch time
+    """
+    return int(time.time())
+
+
+def _to_dict(obj: Any) -> dict:
+    """
+    Converts a config dataclass to a serializable dictionary. Unlike
+    `dataclasses.asdict`, only nested dataclasses are rebuilt; all other
+    values are referenced rather than deep copied.
+
+    :param obj: The dataclass instance to convert
+    :return: The generated dictionary
+    """
+    vals: dict[str, Any] = {}
+
+    for field_ in fields(obj):
+        key = field_.name
         if key.startswith("_"):
             continue
-        if isinstance(val, Path):
+
+        val = getattr(obj, key)
+        if is_dataclass(val):
+            vals[key] = _to_dict(val)
+        elif isinstance(val, Path):
             vals[key] = str(val)
-        elif isinstance(val, datetime):
-            vals[key] = val.isoformat()
         else:
             vals[key] = val
 
     return vals
 
 
-@dataclass
+@dataclass(slots=True)
 class _SecretsConfig:
     default_username: str = "admin"
     default_password: str = "pulsarity"  # noqa: S105
     secret_key: str = field(default_factory=partial(token_urlsafe, 32))
 
 
-@dataclass
+@dataclass(slots=True)
 class _WebserverConfig:
     host: str = "127.0.0.1"
     port: int = 5000
@@ -72,17 +156,18 @@ class _WebserverConfig:
         return self.key_file is not None and self.cert_file is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class _GeneralConfig:
     server_name: str = "Pulsarity"
-    last_modified_time: datetime = field(default_factory=datetime.now)
+    last_modified_time: int = field(default_factory=_epoch_time)
 
     def __post_init__(self):
         if isinstance(self.last_modified_time, str):
-            self.last_modified_time = datetime.fromisoformat(self.last_modified_time)
+            timestamp = datetime.fromisoformat(self.last_modified_time).timestamp()
+            self.last_modified_time = int(timestamp)
 
 
-@dataclass
+@dataclass(slots=True)
 class _SystemDatabaseConfig:
     engine: str = "tortoise.backends.sqlite"
     credentials: dict = field(
@@ -90,7 +175,7 @@ class _SystemDatabaseConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class _EventDatabaseConfig:
     engine: str = "tortoise.backends.sqlite"
     credentials: dict = field(
@@ -98,7 +183,7 @@ class _EventDatabaseConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class _DatabaseConfig:
     system_db: _SystemDatabaseConfig = field(default_factory=_SystemDatabaseConfig)
     event_db: _EventDatabaseConfig = field(default_factory=_EventDatabaseConfig)
@@ -111,12 +196,23 @@ class _DatabaseConfig:
 
     def model_dump(self) -> dict:
         """
-        Dumps the model to a dictionary
+        Dumps the model to a dictionary. The default pragmas are merged into
+        a copy of the credentials for sqlite databases; set values take
+        precedence.
         """
-        return asdict(self)
+        data = _to_dict(self)
+
+        for database in data.values():
+            if database["engine"] == "tortoise.backends.sqlite":
+                database["credentials"] = {
+                    **_SQLITE_PRAGMAS,
+                    **database["credentials"],
+                }
+
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class PulsarityConfig:
     """
     The server configs
@@ -127,7 +223,6 @@ class PulsarityConfig:
     general: _GeneralConfig = field(default_factory=_GeneralConfig)
     database: _DatabaseConfig = field(default_factory=_DatabaseConfig)
     logging: dict = field(default_factory=generate_default_config)
-    _lock: asyncio.locks.Lock = field(default_factory=asyncio.locks.Lock, init=False)
     _from_save: bool = field(default=False, init=False)
 
     def __post_init__(self):
@@ -148,11 +243,9 @@ class PulsarityConfig:
         :param filepath: The filepath to load the config from
         """
         try:
-            with filepath.open("rb") as file:
-                data = json.load(file)
-                config = cls(**data)
-                config.from_save = True
-                return config
+            data = _load_file_data(filepath)
+            config = cls(**data)
+            config.from_save = True
 
         except TypeError:
             logger.exception("Invalid server config file. Using defaults.")
@@ -161,9 +254,11 @@ class PulsarityConfig:
         except FileNotFoundError:
             logger.info("Config file not found. Creating default and file.")
             config_file = cls()
-            config_file.write_config_to_file()
+            config_file.write_config_to_file(filepath)
             return config_file
 
+        return config
+
     @property
     def from_save(self) -> bool:
         """
@@ -178,16 +273,40 @@ class PulsarityConfig:
         """
         self._from_save = status
 
+    def _changed_payload(self, filepath: Path) -> bytes | None:
+        """
+        Serializes the config for writing to a file. The modification time
+        is only updated when the config differs from the contents last read
+        from or written to the file, or the file has since been modified or
+        removed.
+
+        :param filepath: The filepath the config will be saved to
+        :return: The serialized config or `None` when the file is up to date
+        """
+        data = _to_dict(self)
+        payload = orjson.dumps(data, option=_JSON_OPTS)
+
+        cached = _file_cache.get(filepath)
+        if cached is not None and cached[1] == payload:
+            with contextlib.suppress(FileNotFoundError):
+                if filepath.stat().st_mtime_ns == cached[0]:
+                    return None
+
+        self.general.last_modified_time = _epoch_time()
+        data["general"]["last_modified_time"] = self.general.last_modified_time
+
+        return orjson.dumps(data, option=_JSON_OPTS)
+
     def write_config_to_file(self, filepath: Path = DEFAULT_CONFIG_FILE) -> None:
         """
         Writes the current config to a file
 
         :param filepath: The filepath to save the config to
         """
-        self.general.last_modified_time = datetime.now(tz=UTC)
+        if (payload := self._changed_payload(filepath)) is None:
+            return
 
-        with filepath.open("w", encoding="utf-8") as file:
-            json.dump(asdict(self, dict_factory=_parse_types), file, indent=4)
+        _file_cache[filepath] = (_write_file(filepath, payload), payload)
 
     async def write_config_to_file_async(
         self,
@@ -198,13 +317,12 @@ class PulsarityConfig:
 
         :param filepath: The filepath to save the config to
         """
-        async with self._lock:
-            self.general.last_modified_time = datetime.now(tz=UTC)
+        if (payload := self._changed_payload(filepath)) is None:
+            return
 
-            async with await anyio.open_file(filepath, "w", encoding="utf-8") as file:
-                await file.write(
-                    json.dumps(asdict(self, dict_factory=_parse_types), indent=4),
-                )
+        async with _file_locks[filepath]:
+            mtime = await asyncio.to_thread(_write_file, filepath, payload)
+            _file_cache[filepath] = (mtime, payload)
 
 
 config_manager = PulsarityConfig.from_file(DEFAULT_CONFIG_FILE)
@@ -221,8 +221,7 @@ class PulsarityAuthBackend(AuthenticationBackend):
                     user.permissions,
                 ), PulsarityAuthenticatedUser(user)
 
-            User.get_by_uuid_prefetch.cache_invalidate(user_uuid)
+            User.get_by_uuid_prefetch.cache_invalidate(User, user_uuid)
 
-        role = await Role.get(name="UNAUTHENTICATED").prefetch_related("permissions")
-        unauth_perms = await role.get_permissions()
+        unauth_perms = await Role.get_permissions_by_name("UNAUTHENTICATED")
         return PulsarityCredentials(unauth_perms), PulsarityUnauthenticatedUser()
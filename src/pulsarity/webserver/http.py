@@ -87,7 +87,7 @@ async def login(request: _LoginRequest) -> Response:
     start = loop.time()
     evt = asyncio.Event()
 
-    user = await User.get_by_username_prefetch(request.username)
+    user = await User.get_by_username(request.username)
 
     if user is not None and await user.verify_password(request.password):
         request_ = ctx.request_ctx.get()
@@ -101,7 +101,7 @@ async def login(request: _LoginRequest) -> Response:
             auth_id=user.auth_id.hex,
             username=user.username,
             dispay_name=user.display_name,
-            permissions=user.permissions,
+            permissions=await user.get_permissions(),
         )
 
         response = http_pb2.LoginResponse(
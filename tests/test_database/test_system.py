@@ -4,6 +4,7 @@ Test the system database
 
 import pytest
 
+from pulsarity.database import Permission, Role, SystemDefaultPerms
 from pulsarity.database.user import User
 
 
@@ -19,3 +20,86 @@ async def test_user_create():
     user = await User.create(username=username)
     assert await User.get_or_none(username=username) is not None
     assert user.username == username
+
+
+@pytest.mark.asyncio
+async def test_user_prefetch_cache():
+    """
+    Test the cached user lookup is refreshed after the user is updated
+    """
+    user = await User.create(username="foo")
+
+    cached = await User.get_by_uuid_prefetch(user.auth_id)
+    assert cached is not None
+    assert cached.reset_required
+    assert await User.get_by_uuid_prefetch(user.auth_id) is cached
+
+    await User.update_password_required(user.auth_id, False)
+
+    updated = await User.get_by_uuid_prefetch(user.auth_id)
+    assert updated is not None
+    assert not updated.reset_required
+
+
+@pytest.mark.asyncio
+async def test_role_permissions_cache():
+    """
+    Test the cached role permissions are refreshed after the role is updated
+    """
+    role = await Role.get(name="UNAUTHENTICATED")
+
+    permissions = await Role.get_permissions_by_name(role.name)
+    assert permissions == await role.get_permissions()
+    assert SystemDefaultPerms.READ_PILOTS in permissions
+
+    permission = await Permission.get(value=SystemDefaultPerms.RACE_CONTROL)
+    await role.add_permissions(permission)
+
+    permissions = await Role.get_permissions_by_name(role.name)
+    assert permissions == {SystemDefaultPerms.RACE_CONTROL}
+
+
+@pytest.mark.asyncio
+async def test_role_permissions_cache_verify():
+    """
+    Test the cached role permissions are refreshed by the persistent role sync
+    """
+    role = await Role.get(name="SYSTEM_ADMIN")
+    permission = await Permission.get(value=SystemDefaultPerms.RACE_CONTROL)
+
+    await role.permissions.remove(permission)
+    permissions = await Role.get_permissions_by_name(role.name)
+    assert SystemDefaultPerms.RACE_CONTROL not in permissions
+
+    await Role.verify_persistant()
+
+    permissions = await Role.get_permissions_by_name(role.name)
+    assert SystemDefaultPerms.RACE_CONTROL in permissions
+
+
+@pytest.mark.asyncio
+async def test_user_permissions():
+    """
+    Test the single query user permissions match the prefetched permissions
+    """
+    user = await User.create(username="foo")
+    await user.roles.add(*await Role.all())
+
+    prefetched = await User.get_by_uuid_prefetch(user.auth_id)
+    assert prefetched is not None
+    assert await user.get_permissions() == prefetched.permissions
+    assert SystemDefaultPerms.SYSTEM_CONTROL in prefetched.permissions
+
+
+@pytest.mark.asyncio
+async def test_user_login_time():
+    """
+    Test updating the last login time of a user
+    """
+    user = await User.create(username="foo")
+    assert user.last_login is None
+
+    await user.update_user_login_time()
+
+    user = await User.get(id=user.id)
+    assert user.last_login is not None
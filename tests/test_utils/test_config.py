@@ -0,0 +1,128 @@
+"""
+Test the server configs
+"""
+
+import os
+from pathlib import Path
+
+import orjson
+import pytest
+
+from pulsarity.utils import config
+from pulsarity.utils.config import PulsarityConfig
+
+
+def test_config_file_roundtrip(tmp_path: Path):
+    """
+    Test writing a config to a file and loading it back
+    """
+    filepath = tmp_path / "config.json"
+
+    configs = PulsarityConfig()
+    configs.write_config_to_file(filepath)
+
+    loaded = PulsarityConfig.from_file(filepath)
+
+    assert loaded.from_save
+    assert loaded.secrets.secret_key == configs.secrets.secret_key
+    assert loaded.webserver.port == configs.webserver.port
+
+
+def test_config_file_cache(tmp_path: Path):
+    """
+    Test the raw file contents are kept after loading a config
+    """
+    filepath = tmp_path / "config.json"
+
+    PulsarityConfig().write_config_to_file(filepath)
+    config._file_cache.clear()
+
+    data = config._load_file_data(filepath)
+
+    assert config._file_cache[filepath][1] == filepath.read_bytes()
+    assert data == orjson.loads(filepath.read_bytes())
+
+
+def test_config_file_missing(tmp_path: Path):
+    """
+    Test a missing config file is created at the requested filepath
+    """
+    filepath = tmp_path / "config.json"
+
+    configs = PulsarityConfig.from_file(filepath)
+
+    assert not configs.from_save
+    assert filepath.exists()
+    assert config._file_cache[filepath][1] == filepath.read_bytes()
+
+
+def test_config_unchanged_write(tmp_path: Path):
+    """
+    Test writing an unchanged config skips the file write
+    """
+    filepath = tmp_path / "config.json"
+
+    configs = PulsarityConfig()
+    configs.write_config_to_file(filepath)
+    cached = config._file_cache[filepath]
+
+    configs.write_config_to_file(filepath)
+    assert config._file_cache[filepath] is cached
+
+    configs.general.server_name = "foo"
+    configs.write_config_to_file(filepath)
+    assert config._file_cache[filepath] is not cached
+
+
+def test_config_unchanged_write_file_modified(tmp_path: Path):
+    """
+    Test an unchanged config is written when the file was removed or edited
+    """
+    filepath = tmp_path / "config.json"
+
+    configs = PulsarityConfig()
+    configs.write_config_to_file(filepath)
+
+    filepath.unlink()
+    configs.write_config_to_file(filepath)
+    assert filepath.exists()
+
+    mtime = filepath.stat().st_mtime_ns
+    filepath.write_bytes(b"{}")
+    os.utime(filepath, ns=(mtime + 1, mtime + 1))
+    configs.write_config_to_file(filepath)
+    data = orjson.loads(filepath.read_bytes())
+    assert data["secrets"]["secret_key"] == configs.secrets.secret_key
+
+
+def test_config_failed_write(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test a failed write leaves no temporary file behind
+    """
+    filepath = tmp_path / "config.json"
+
+    def _fail(_):
+        raise OSError
+
+    monkeypatch.setattr(config.os, "fsync", _fail)
+
+    with pytest.raises(OSError):
+        PulsarityConfig().write_config_to_file(filepath)
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_config_sqlite_pragmas():
+    """
+    Test the default sqlite pragmas are dumped without overriding set values
+    """
+    credentials = {"file_path": "a.db", "cache_size": 10}
+    configs = PulsarityConfig(database={"system_db": {"credentials": credentials}})
+
+    connections = configs.database.model_dump()
+
+    system_creds = connections["system_db"]["credentials"]
+    assert system_creds["cache_size"] == 10
+    assert system_creds["synchronous"] == "NORMAL"
+    assert connections["event_db"]["credentials"]["temp_store"] == "MEMORY"
+    assert credentials == {"file_path": "a.db", "cache_size": 10}